@@ -22,29 +22,41 @@ if TYPE_CHECKING:
 
 
 class BiblioRefPool:
+    __slots__ = ('_orig', '_orig_index', '_orig_order', '_rord_index', 'used')
+
     def __init__(self, orig: Iterable[BiblioRefItem]):
         self._orig = list(orig)
         self.used: list[BiblioRefItem] = []
         self._orig_order = True
+        # indexes from id to first matching position (zero-based in _orig, rord in used)
+        self._orig_index: dict[str, int] = {}
+        for zidx, ref in enumerate(self._orig):
+            self._orig_index.setdefault(ref.id, zidx)
+        self._rord_index: dict[str, int] = {}
 
     def is_bibr_rid(self, rid: str | None) -> bool:
-        return bool(rid) and any(rid == ref.id for ref in self._orig)
+        return bool(rid) and rid in self._orig_index
+
+    def _use(self, ref: BiblioRefItem) -> None:
+        self.used.append(ref)
+        self._rord_index.setdefault(ref.id, len(self.used))
 
     def cite(self, rid: str, ideal_rord: int | None = None) -> Citation | None:
-        for zidx, ref in enumerate(self.used):
-            if rid == ref.id:
-                return Citation(rid, zidx + 1)
-        for zidx, ref in enumerate(self._orig):
-            if rid == ref.id:
-                if self._orig_order:
-                    if zidx + 1 == ideal_rord:
-                        for j in range(len(self.used), zidx):
-                            self.used.append(self._orig[j])
-                    else:
-                        self._orig_order = False
-                self.used.append(ref)
-                return Citation(rid, len(self.used))
-        return None
+        rord = self._rord_index.get(rid)
+        if rord is not None:
+            return Citation(rid, rord)
+        zidx = self._orig_index.get(rid)
+        if zidx is None:
+            return None
+        if self._orig_order:
+            if zidx + 1 == ideal_rord:
+                use, orig = self._use, self._orig
+                for j in range(len(self.used), zidx):
+                    use(orig[j])
+            else:
+                self._orig_order = False
+        self._use(self._orig[zidx])
+        return Citation(rid, len(self.used))
 
     def get_by_rord(self, rord: int) -> BiblioRefItem:
         """Get using one-based index of 'rord' value"""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import ClassVar, Iterable
@@ -105,10 +106,8 @@ class CcLicenseType(StrEnum):
 
     @staticmethod
     def from_url(url: str) -> CcLicenseType | None:
-        for prefix, matching_type in _CC_URLS.items():
-            if url.startswith(prefix):
-                return matching_type
-        return None
+        match = _CC_URL_PREFIX.match(url)
+        return _CC_URLS[match.group()] if match else None
 
 
 _CC_URLS = {
@@ -121,6 +120,8 @@ _CC_URLS = {
     'https://creativecommons.org/licenses/by-nc-nd/': CcLicenseType.BYNCND,
 }
 
+_CC_URL_PREFIX = re.compile('|'.join(map(re.escape, _CC_URLS)))
+
 
 @dataclass
 class License:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from .. import condition as fc
@@ -17,12 +18,17 @@ if TYPE_CHECKING:
     from ..typeshed import XmlElement
 
 
+_SURNAME_MODEL = tag_model('surname', kit.load_string)
+_GIVEN_NAMES_MODEL = tag_model('given-names', kit.load_string)
+_SUFFIX_MODEL = tag_model('suffix', kit.load_string)
+
+
 def load_person_name(log: Log, e: XmlElement) -> bp.PersonName | None:
     kit.check_no_attrib(log, e)
     sess = ArrayContentSession()
-    surname = sess.one(tag_model('surname', kit.load_string))
-    given_names = sess.one(tag_model('given-names', kit.load_string))
-    suffix = sess.one(tag_model('suffix', kit.load_string))
+    surname = sess.one(_SURNAME_MODEL)
+    given_names = sess.one(_GIVEN_NAMES_MODEL)
+    suffix = sess.one(_SUFFIX_MODEL)
     sess.parse_content(log, e)
     if not surname.out and not given_names.out:
         log(fc.MissingContent.issue(e, "Missing surname or given-names element."))
@@ -35,23 +41,31 @@ class PersonGroupModel(kit.TagModelBase[bp.PersonGroup]):
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/person-group.html
     """
 
+    __slots__ = ()
+
+    _NAME = tag_model('name', load_person_name)
+    _STRING_NAME = tag_model('string-name', kit.load_string)
+    _ETAL = TrivialElementModel('etal')
+
     def __init__(self, group_type: str) -> None:
         super().__init__(StartTag('person-group', {'person-group-type': group_type}))
 
     def load(self, log: Log, e: XmlElement) -> bp.PersonGroup | None:
         ret = bp.PersonGroup()
         k = 'person-group-type'
-        kit.check_no_attrib(log, e, [k])
+        kit.check_no_attrib(log, e, (k,))
         sess = ArrayContentSession()
-        sess.bind(tag_model('name', load_person_name), ret.persons.append)
-        sess.bind(tag_model('string-name', kit.load_string), ret.persons.append)
-        etal = sess.one(TrivialElementModel('etal'))
+        sess.bind(self._NAME, ret.persons.append)
+        sess.bind(self._STRING_NAME, ret.persons.append)
+        etal = sess.one(self._ETAL)
         sess.parse_content(log, e)
         ret.etal = bool(etal.out)
         return ret
 
 
 class PositiveIntModel(kit.LoadModelBase[int]):
+    __slots__ = ('max_int', 'strip_trailing_period', 'tag')
+
     def __init__(self, tag: str, max_int: int, *, strip_trailing_period: bool = False):
         self.tag = tag
         self.max_int = max_int
@@ -60,20 +74,29 @@ class PositiveIntModel(kit.LoadModelBase[int]):
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == self.tag
 
+    def match_tags(self) -> Iterable[str]:
+        return (self.tag,)
+
     def load(self, log: Log, e: XmlElement) -> int | None:
         kit.check_no_attrib(log, e)
         ret = kit.load_int(log, e, strip_trailing_period=self.strip_trailing_period)
-        if ret and ret not in range(1, self.max_int + 1):
+        if ret and not 1 <= ret <= self.max_int:
             log(fc.UnsupportedAttributeValue.issue(e, self.tag, str(ret)))
             ret = None
         return ret
 
 
 class DateBuilder:
+    __slots__ = ('day', 'month', 'year')
+
+    _YEAR = tag_model('year', kit.load_int)
+    _MONTH = PositiveIntModel('month', 12)
+    _DAY = PositiveIntModel('day', 31)
+
     def __init__(self, sess: ArrayContentSession):
-        self.year = sess.one(tag_model('year', kit.load_int))
-        self.month = sess.one(PositiveIntModel('month', 12))
-        self.day = sess.one(PositiveIntModel('day', 31))
+        self.year = sess.one(self._YEAR)
+        self.month = sess.one(self._MONTH)
+        self.day = sess.one(self._DAY)
 
     def build(self) -> bp.Date | None:
         ret = None
@@ -92,11 +115,13 @@ class AccessDateModel(kit.TagModelBase[bp.Date]):
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/date-in-citation.html
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__('date-in-citation')
 
     def load(self, log: Log, xe: XmlElement) -> bp.Date | None:
-        kit.check_no_attrib(log, xe, ['content-type'])
+        kit.check_no_attrib(log, xe, ('content-type',))
         if xe.attrib.get('content-type') != 'access-date':
             return None
         sess = ArrayContentSession()
@@ -111,11 +136,16 @@ class PubIdParser(kit.Parser[dict[bp.PubIdType, str]]):
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/pub-id.html
     """
 
+    __slots__ = ()
+
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'pub-id'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('pub-id',)
+
     def parse(self, log: Log, e: XmlElement, dest: dict[bp.PubIdType, str]) -> bool:
-        kit.check_no_attrib(log, e, ['pub-id-type'])
+        kit.check_no_attrib(log, e, ('pub-id-type',))
         pub_id_type = kit.get_enum_value(log, e, 'pub-id-type', bp.PubIdType)
         if not pub_id_type:
             log(fc.InvalidPubId.issue(e))
@@ -158,10 +188,38 @@ def load_edition(log: Log, e: XmlElement) -> int | None:
     return ret
 
 
+class BiblioFieldsParser(kit.Parser[dict[str, str]]):
+    """Simple string fields of an element citation, each at most once."""
+
+    __slots__ = ()
+
+    TAGS = frozenset(bp.BiblioRefItem.BIBLIO_FIELD_KEYS)
+
+    def match(self, xe: XmlElement) -> bool:
+        return xe.tag in self.TAGS
+
+    def match_tags(self) -> Iterable[str]:
+        return self.TAGS
+
+    def parse(self, log: Log, e: XmlElement, dest: dict[str, str]) -> bool:
+        key = str(e.tag)
+        if key in dest:
+            log(fc.ExcessElement.issue(e))
+            return False
+        dest[key] = kit.load_string(log, e)
+        return True
+
+
 class SourceTitleModel(kit.LoadModelBase[str]):
+    __slots__ = ()
+
+    TAGS = ('source-title', 'source')  # JATS/HTML conflict in use of <source> tag
+
     def match(self, xe: XmlElement) -> bool:
-        # JATS/HTML conflict in use of <source> tag
-        return xe.tag in ['source-title', 'source']
+        return xe.tag in self.TAGS
+
+    def match_tags(self) -> Iterable[str]:
+        return self.TAGS
 
     def load(self, log: Log, xe: XmlElement) -> str | None:
         return kit.load_string(log, xe)
@@ -173,24 +231,38 @@ class ElementCitationParser(kit.Parser[bp.BiblioRefItem]):
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/element-citation.html
     """
 
+    __slots__ = ()
+
+    _SOURCE_TITLE = SourceTitleModel()
+    _ARTICLE_TITLE = tag_model('article-title', kit.load_string)
+    _AUTHORS = PersonGroupModel('author')
+    _EDITORS = PersonGroupModel('editor')
+    _EDITION = tag_model('edition', load_edition)
+    _ACCESS_DATE = AccessDateModel()
+    _FIELDS = BiblioFieldsParser()
+    _ELOCATION_ID = tag_model('elocation-id', kit.load_string)
+    _PUB_ID = PubIdParser()
+
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'element-citation'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('element-citation',)
+
     def parse(self, log: Log, e: XmlElement, dest: bp.BiblioRefItem) -> bool:
         kit.check_no_attrib(log, e)
         sess = ArrayContentSession()
-        source_title = sess.one(SourceTitleModel())
-        title = sess.one(tag_model('article-title', kit.load_string))
-        authors = sess.one(PersonGroupModel('author'))
-        editors = sess.one(PersonGroupModel('editor'))
-        edition = sess.one(tag_model('edition', load_edition))
+        source_title = sess.one(self._SOURCE_TITLE)
+        title = sess.one(self._ARTICLE_TITLE)
+        authors = sess.one(self._AUTHORS)
+        editors = sess.one(self._EDITORS)
+        edition = sess.one(self._EDITION)
         date = DateBuilder(sess)
-        access_date = sess.one(AccessDateModel())
-        fields = {}
-        for key in bp.BiblioRefItem.BIBLIO_FIELD_KEYS:
-            fields[key] = sess.one(tag_model(key, kit.load_string))
-        elocation_id = sess.one(tag_model('elocation-id', kit.load_string))
-        sess.bind(PubIdParser(), dest.pub_ids)
+        access_date = sess.one(self._ACCESS_DATE)
+        fields: dict[str, str] = {}
+        sess.bind(self._FIELDS, fields)
+        elocation_id = sess.one(self._ELOCATION_ID)
+        sess.bind(self._PUB_ID, dest.pub_ids)
         sess.parse_content(log, e)
         dest.source_title = source_title.out
         dest.article_title = title.out
@@ -201,9 +273,11 @@ class ElementCitationParser(kit.Parser[bp.BiblioRefItem]):
         dest.edition = edition.out
         dest.date = date.build()
         dest.access_date = access_date.out
-        for key, parser in fields.items():
-            if parser.out:
-                dest.biblio_fields[key] = parser.out
+        if fields:
+            # keep the canonical field order rather than document order
+            for key in bp.BiblioRefItem.BIBLIO_FIELD_KEYS:
+                if value := fields.get(key):
+                    dest.biblio_fields[key] = value
         if elocation_id.out:
             if 'fpage' in dest.biblio_fields:
                 msg = "elocation-id dropped since fpage present"
@@ -219,22 +293,31 @@ class BiblioRefItemModel(kit.TagModelBase[bp.BiblioRefItem]):
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/ref.html
     """
 
+    __slots__ = ()
+
+    _LABEL = PositiveIntModel('label', 1048576, strip_trailing_period=True)
+    _ELEMENT_CITATION = ElementCitationParser()
+
     def __init__(self) -> None:
         super().__init__('ref')
 
     def load(self, log: Log, xe: XmlElement) -> bp.BiblioRefItem | None:
         ret = bp.BiblioRefItem()
-        kit.check_no_attrib(log, xe, ['id'])
+        kit.check_no_attrib(log, xe, ('id',))
         sess = ArrayContentSession()
-        label = PositiveIntModel('label', 1048576, strip_trailing_period=True)
-        sess.one(label)  # ignoring if it's a valid integer
-        sess.bind_once(ElementCitationParser(), ret)
+        sess.one(self._LABEL)  # ignoring if it's a valid integer
+        sess.bind_once(self._ELEMENT_CITATION, ret)
         sess.parse_content(log, xe)
         ret.id = xe.attrib.get('id', "")
         return ret
 
 
 class RefListModel(kit.TagModelBase[dom.BiblioRefList]):
+    __slots__ = ()
+
+    _TITLE = tag_model('title', kit.load_string)
+    _REF = BiblioRefItemModel()
+
     def __init__(self) -> None:
         super().__init__('ref-list')
 
@@ -242,8 +325,8 @@ class RefListModel(kit.TagModelBase[dom.BiblioRefList]):
         ret = dom.BiblioRefList()
         kit.check_no_attrib(log, e)
         sess = ArrayContentSession()
-        title = sess.one(tag_model('title', kit.load_string))
-        sess.bind(BiblioRefItemModel(), ret.references.append)
+        title = sess.one(self._TITLE)
+        sess.bind(self._REF, ret.references.append)
         sess.parse_content(log, e)
         if title.out and title.out != "References":
             log(fc.IgnoredText.issue(e, 'ref-list/title ignored'))
@@ -5,23 +5,26 @@ from __future__ import annotations
 import tempfile
 import xml.etree.ElementTree
 from pathlib import Path
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from .. import dom
 from .. import condition as fc
+from .. import metadata as bp
 from ..biblio import BiblioRefPool
 
 from . import kit
-from .back import RefListModel
-from .body import BodyModel
+from .back import BiblioRefItemModel, RefListModel
+from .body import BodyModel, core_models
 from .content import ArrayContentSession
 from .front import AbstractModel, ArticleFrontParser
 from .kit import Log, nolog
 
 if TYPE_CHECKING:
     from types import ModuleType
-    from ..typeshed import XmlElement
+    from ..typeshed import StrPath, XmlElement
     import hidos
+    import lxml.etree
 
 
 NAMESPACE_MAP = {
@@ -68,18 +71,29 @@ def load_article(log: Log, e: XmlElement) -> dom.Article | None:
 
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/article.html
     """
+    back_log = list[fc.FormatIssue]()
+    ref_list = pop_load_sub_back(back_log.append, e)
+    return load_article_sans_back(log, e, ref_list, back_log)
+
+
+def load_article_sans_back(
+    log: Log,
+    e: XmlElement,
+    ref_list: dom.BiblioRefList | None,
+    back_log: Iterable[fc.FormatIssue],
+) -> dom.Article:
     lang = '{http://www.w3.org/XML/1998/namespace}lang'
-    kit.confirm_attrib_value(log, e, lang, ['en', None])
-    kit.check_no_attrib(log, e, [lang])
+    kit.confirm_attrib_value(log, e, lang, ('en', None))
+    kit.check_no_attrib(log, e, (lang,))
     ret = dom.Article()
-    back_log = list[fc.FormatIssue]()
-    ret.ref_list = pop_load_sub_back(back_log.append, e)
+    ret.ref_list = ref_list
     biblio = BiblioRefPool(ret.ref_list.references) if ret.ref_list else None
-    abstract_model = AbstractModel(biblio)
+    core = core_models(biblio)
+    abstract_model = AbstractModel(biblio, core=core)
     kit.check_required_child(log, e, 'front')
     sess = ArrayContentSession()
     sess.bind_once(ArticleFrontParser(abstract_model), ret)
-    sess.bind(BodyModel(biblio), ret.body)
+    sess.bind(BodyModel(biblio, core=core), ret.body)
     sess.parse_content(log, e)
     if ret.ref_list:
         assert biblio
@@ -93,6 +107,77 @@ def load_article(log: Log, e: XmlElement) -> dom.Article | None:
     return ret
 
 
+def _parent_back_ref_list(xe: lxml.etree._Element) -> lxml.etree._Element | None:
+    """The first <ref-list> of the first <back> of the root, if parent of xe.
+
+    Only this reference list is loaded by pop_load_sub_back. Any other is left
+    in the tree to be reported the same way as when not streaming.
+    """
+    ref_list = xe.getparent()
+    if ref_list is None or ref_list.tag != 'ref-list':
+        return None
+    back = ref_list.getparent()
+    if back is None or back.tag != 'back':
+        return None
+    root = back.getparent()
+    if root is None or root.getparent() is not None:
+        return None
+    if root.find('back') is not back or back.find('ref-list') is not ref_list:
+        return None
+    return ref_list
+
+
+def load_article_stream(log: Log, src: StrPath) -> dom.Article | None:
+    """Load <article> while parsing XML, releasing each <ref> once loaded.
+
+    Loading gives the same result and issues as parse_baseprint, but the <ref>
+    elements of the reference list are loaded as soon as they are parsed and
+    then removed from the XML tree. Only the loaded reference items are kept
+    in memory, not their XML source as well. Issues within <ref> elements are
+    logged before other issues of <back>, so the order of issues may differ.
+    """
+    path = Path(src)
+    xml_path = path / "article.xml" if path.is_dir() else path
+    ET = get_ET(use_lxml=True)
+    ref_model = BiblioRefItemModel()
+    refs: list[bp.BiblioRefItem] = []
+    back_log = list[fc.FormatIssue]()
+    context = ET.iterparse(
+        xml_path, events=('end',), tag='ref', remove_comments=True, remove_pis=True
+    )
+    try:
+        for _event, xe in context:
+            ref_list_xe = _parent_back_ref_list(xe)
+            if ref_list_xe is not None:
+                tail = xe.tail
+                xe.tail = None
+                if ref := ref_model.load(back_log.append, xe):
+                    refs.append(ref)
+                if tail and tail.strip():
+                    back_log.append(fc.IgnoredTail.issue(xe))
+                ref_list_xe.remove(xe)
+    except ET.ParseError as ex:
+        kit.issue(log, fc.XMLSyntaxError(), ex.lineno, ex.msg)
+        return None
+    root = context.root
+    assert root is not None
+    check_docinfo(log, root.getroottree().docinfo)
+    if root.tag != 'article':
+        log(fc.UnsupportedElement.issue(root))
+        return None
+    ref_list = pop_load_sub_back(back_log.append, root)
+    if ref_list is not None:
+        ref_list.references[:0] = refs
+    return load_article_sans_back(log, root, ref_list, back_log)
+
+
+def check_docinfo(log: Log, docinfo: lxml.etree.DocInfo) -> None:
+    if bool(docinfo.doctype):
+        kit.issue(log, fc.DoctypeDeclaration())
+    if docinfo.encoding.lower() != "utf-8":
+        kit.issue(log, fc.EncodingNotUtf8(docinfo.encoding))
+
+
 def parse_baseprint_root(root: XmlElement, log: Log = nolog) -> dom.Article | None:
     if root.tag != 'article':
         log(fc.UnsupportedElement.issue(root))
@@ -121,10 +206,7 @@ def parse_baseprint(
         return None
 
     if hasattr(et, 'docinfo'):
-        if bool(et.docinfo.doctype):
-            kit.issue(log, fc.DoctypeDeclaration())
-        if et.docinfo.encoding.lower() != "utf-8":
-            kit.issue(log, fc.EncodingNotUtf8(et.docinfo.encoding))
+        check_docinfo(log, et.docinfo)
 
     return parse_baseprint_root(et.getroot(), log)
 
@@ -136,4 +218,4 @@ def baseprint_from_edition(ed: hidos.Edition) -> dom.Article | None:
         snapshot = Path(tempdir) / "snapshot"
         ed.snapshot.copy(snapshot)
         article_xml = snapshot / "article.xml"
-        return parse_baseprint(article_xml, use_lxml=False)
+        return parse_baseprint(article_xml)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable
+from functools import cache
 from typing import TYPE_CHECKING
 
 from .. import dom
@@ -58,6 +59,8 @@ def hypertext_model(biblio: BiblioRefPool | None, *, math: bool = True) -> Mixed
 
 
 class CoreModels:
+    __slots__ = ('block', 'inline', 'roll')
+
     def __init__(
         self,
         biblio: BiblioRefPool | None,
@@ -80,14 +83,32 @@ class CoreModels:
             self.block |= table_or_wrap_model(self.roll)
 
 
+@cache
+def _core_models_sans_biblio() -> CoreModels:
+    return CoreModels(None)
+
+
+def core_models(biblio: BiblioRefPool | None) -> CoreModels:
+    """CoreModels with math and tables.
+
+    Without citations models have no per-document state and are shared.
+    Models with citations are per BiblioRefPool, so build once per document.
+    """
+    return CoreModels(biblio) if biblio else _core_models_sans_biblio()
+
+
 def roll_model(
     biblio: BiblioRefPool | None, *, math: bool = True, tables: bool = True
 ) -> ArrayContentModel:
+    if math and tables:
+        return core_models(biblio).roll
     core = CoreModels(biblio, math=math, tables=tables)
     return core.roll
 
 
 class CitationModel(kit.LoadModelBase[Citation]):
+    __slots__ = ('biblio',)
+
     def __init__(self, biblio: BiblioRefPool):
         self.biblio = biblio
 
@@ -95,34 +116,42 @@ class CitationModel(kit.LoadModelBase[Citation]):
         # JatsCrossReferenceModel is the opposing <xref> model to CitationModel
         if xe.tag != 'xref':
             return False
-        if xe.attrib.get('ref-type') == 'bibr':
+        attrib = xe.attrib
+        if attrib.get('ref-type') == 'bibr':
             return True
-        return self.biblio.is_bibr_rid(xe.attrib.get("rid"))
+        return self.biblio.is_bibr_rid(attrib.get("rid"))
+
+    def match_tags(self) -> Iterable[str]:
+        return ('xref',)
 
     def load(self, log: Log, e: XmlElement) -> Citation | None:
-        alt = e.attrib.get("alt")
-        if alt and alt == e.text and not len(e):
-            del e.attrib["alt"]
-        kit.check_no_attrib(log, e, ["rid", "ref-type"])
-        rid = e.attrib.get("rid")
+        attrib = e.attrib
+        text = e.text
+        alt = attrib.get("alt")
+        if alt and alt == text and not len(e):
+            del attrib["alt"]
+        kit.check_no_attrib(log, e, ("rid", "ref-type"))
+        rid = attrib.get("rid")
         if rid is None:
             log(fc.MissingAttribute.issue(e, "rid"))
             return None
         for s in e:
             log(fc.UnsupportedElement.issue(s))
         try:
-            rord = int(e.text or '')
+            rord = int(text or '')
         except ValueError:
             rord = None
         ret = self.biblio.cite(rid, rord)
         if not ret:
             log(fc.InvalidCitation.issue(e, rid))
-        elif e.text and not ret.matching_text(e.text):
+        elif text and not ret.matching_text(text):
             log(fc.IgnoredText.issue(e))
         return ret
 
 
 class AutoCorrectCitationModel(kit.LoadModelBase[CitationTuple]):
+    __slots__ = ('_submodel',)
+
     def __init__(self, biblio: BiblioRefPool):
         submodel = CitationModel(biblio)
         self._submodel = submodel
@@ -130,83 +159,110 @@ class AutoCorrectCitationModel(kit.LoadModelBase[CitationTuple]):
     def match(self, xe: XmlElement) -> bool:
         return self._submodel.match(xe)
 
+    def match_tags(self) -> Iterable[str]:
+        return self._submodel.match_tags()
+
     def load(self, log: Log, e: XmlElement) -> CitationTuple | None:
         citation = self._submodel.load(log, e)
         return CitationTuple([citation]) if citation else None
 
 
+_TUPLE_OPENERS = frozenset(('', '[', '('))
+_RANGE_DASHES = frozenset('-\u2010\u2011\u2012\u2013\u2014')
+_TUPLE_DELIMITERS = frozenset(('', ',', ';', ']', ')'))
+
+
 class CitationRangeHelper:
+    __slots__ = ('_biblio', 'log', 'starter', 'stopper')
+
     def __init__(self, log: Log, biblio: BiblioRefPool):
-        self.log = log
         self._biblio = biblio
+        self.reset(log)
+
+    def reset(self, log: Log) -> None:
+        """Start helping with a new citation tuple."""
+        self.log = log
         self.starter: Citation | None = None
         self.stopper: Citation | None = None
 
     @staticmethod
     def is_tuple_open(text: str | None) -> bool:
-        delim = text.strip() if text else ''
-        return delim in {'', '[', '('}
-
-    def _inner_range(self, before: Citation, after: Citation) -> Iterator[Citation]:
-        for rord in range(before.rord + 1, after.rord):
-            rid = self._biblio.get_by_rord(rord).id
-            yield Citation(rid, rord)
-
-    def get_range(self, child: XmlElement, citation: Citation) -> Iterator[Citation]:
-        if citation.matching_text(child.text):
-            self.stopper = citation
-        if self.starter:
-            if self.stopper:
-                return self._inner_range(self.starter, self.stopper)
-            else:
-                msg = f"Invalid citation '{citation.rid}' to end range"
-                self.log(fc.InvalidCitation.issue(child, msg))
-        return iter(())
+        return not text or text.strip() in _TUPLE_OPENERS
 
-    def new_start(self, child: XmlElement) -> None:
-        delim = child.tail.strip() if child.tail else ''
-        if delim in {'-', '\u2010', '\u2011', '\u2012', '\u2013', '\u2014'}:
+    def advance(
+        self, child: XmlElement, citation: Citation | None, out: Sink[Citation]
+    ) -> None:
+        """Output citation, after any implied by a range it ends, then check tail."""
+        if citation is not None:
+            if citation.matching_text(child.text):
+                self.stopper = citation
+            if self.starter:
+                if self.stopper:
+                    get_by_rord = self._biblio.get_by_rord
+                    for rord in range(self.starter.rord + 1, self.stopper.rord):
+                        out(Citation(get_by_rord(rord).id, rord))
+                else:
+                    msg = f"Invalid citation '{citation.rid}' to end range"
+                    self.log(fc.InvalidCitation.issue(child, msg))
+            out(citation)
+        tail = child.tail
+        delim = tail.strip() if tail else ''
+        if delim in _RANGE_DASHES:
             self.starter = self.stopper
             if not self.starter:
                 msg = "Invalid citation to start range"
                 self.log(fc.InvalidCitation.issue(child, msg))
         else:
             self.starter = None
-            if delim not in {'', ',', ';', ']', ')'}:
+            if delim not in _TUPLE_DELIMITERS:
                 self.log(fc.IgnoredTail.issue(child))
         self.stopper = None
 
 
 class CitationTupleModel(kit.LoadModelBase[CitationTuple]):
+    __slots__ = ('_range_helper', '_submodel')
+
     def __init__(self, biblio: BiblioRefPool):
         super().__init__()
         self._submodel = CitationModel(biblio)
+        # reused by each load call since citation tuples do not nest
+        self._range_helper = CitationRangeHelper(kit.nolog, biblio)
 
     def match(self, xe: XmlElement) -> bool:
         # Minor break of backwards compat to BpDF ed.1 where
         # xref inside sup might be what is now <a href="#...">
         # But no known archived baseprint did this.
-        return xe.tag == 'sup' and any(c.tag == 'xref' for c in xe)
+        if xe.tag != 'sup':
+            return False
+        for c in xe:
+            if c.tag == 'xref':
+                return True
+        return False
+
+    def match_tags(self) -> Iterable[str]:
+        return ('sup',)
 
     def load(self, log: Log, e: XmlElement) -> CitationTuple | None:
         kit.check_no_attrib(log, e)
-        range_helper = CitationRangeHelper(log, self._submodel.biblio)
+        range_helper = self._range_helper
+        range_helper.reset(log)
         if not range_helper.is_tuple_open(e.text):
             log(fc.IgnoredText.issue(e))
-        ret = CitationTuple()
+        citations: list[Citation] = []
+        load_if_match = self._submodel.load_if_match
+        append = citations.append
+        advance = range_helper.advance
         for child in e:
-            citation = self._submodel.load_if_match(log, child)
+            citation = load_if_match(log, child)
             if citation is None:
                 log(fc.UnsupportedElement.issue(child))
-            else:
-                for implied in range_helper.get_range(child, citation):
-                    ret.append(implied)
-                ret.append(citation)
-            range_helper.new_start(child)
-        return ret if len(ret) else None
+            advance(child, citation, append)
+        return CitationTuple(citations) if citations else None
 
 
 class JatsCrossReferenceModel(kit.LoadModelBase[dom.CrossReference]):
+    __slots__ = ('biblio', 'content_model')
+
     def __init__(self, content_model: MixedModel, biblio: BiblioRefPool | None):
         self.content_model = content_model
         self.biblio = biblio
@@ -215,33 +271,50 @@ class JatsCrossReferenceModel(kit.LoadModelBase[dom.CrossReference]):
         # CitationModel is the opposing <xref> model to JatsCrossReferenceModel
         if xe.tag != 'xref':
             return False
-        if xe.attrib.get('ref-type') == 'bibr':
+        attrib = xe.attrib
+        if attrib.get('ref-type') == 'bibr':
             return False
-        return not (self.biblio and self.biblio.is_bibr_rid(xe.attrib.get("rid")))
+        return not (self.biblio and self.biblio.is_bibr_rid(attrib.get("rid")))
+
+    def match_tags(self) -> Iterable[str]:
+        return ('xref',)
 
     def load(self, log: Log, e: XmlElement) -> dom.CrossReference | None:
-        alt = e.attrib.get("alt")
-        if alt and alt == e.text and not len(e):
-            del e.attrib["alt"]
-        kit.check_no_attrib(log, e, ["rid"])
-        rid = e.attrib.get("rid")
+        text_only = not len(e)
+        attrib = e.attrib
+        text = e.text
+        alt = attrib.get("alt")
+        if alt and alt == text and text_only:
+            del attrib["alt"]
+        kit.check_no_attrib(log, e, ("rid",))
+        rid = attrib.get("rid")
         if rid is None:
             log(fc.MissingAttribute.issue(e, "rid"))
             return None
         ret = dom.CrossReference(rid)
-        self.content_model.parse_content(log, e, ret.append)
+        if text_only:
+            # common case of plain text reference needs no content model
+            if text:
+                ret.append(text)
+        else:
+            self.content_model.parse_content(log, e, ret.append)
         return ret
 
 
 class HtmlCrossReferenceModel(MixedModel):
+    __slots__ = ('content_model',)
+
     def __init__(self, content_model: MixedModel):
         self.content_model = content_model
 
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'a' and 'rel' not in xe.attrib
 
+    def match_tags(self) -> Iterable[str]:
+        return ('a',)
+
     def parse(self, log: Log, xe: XmlElement, out: Sink[str | Element]) -> bool:
-        kit.check_no_attrib(log, xe, ['href'])
+        kit.check_no_attrib(log, xe, ('href',))
         href = xe.attrib.get("href")
         if href is None:
             log(fc.MissingAttribute.issue(xe, "href"))
@@ -266,7 +339,12 @@ def cross_reference_model(
     return HtmlCrossReferenceModel(content_model) | jats_xref
 
 
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'title'))
+
+
 class ProtoSectionParser:
+    __slots__ = ('section_model',)
+
     def __init__(self, section_model: SectionModel):
         self.section_model = section_model
 
@@ -285,7 +363,7 @@ class ProtoSectionParser:
         for s in xe:
             tail = s.tail
             s.tail = None
-            if s.tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'title']:
+            if s.tag in _HEADING_TAGS:
                 if title is None:
                     log(fc.ExcessElement.issue(s))
                 else:
@@ -311,16 +389,23 @@ class SectionModel(kit.LoadModelBase[dom.Section]):
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/sec.html
     """
 
+    __slots__ = ('_proto', 'block_model', 'inline_model')
+
+    TAGS = ('section', 'sec')
+
     def __init__(self, block_model: Model[Element], inline_model: MixedModel):
         self.block_model = block_model
         self.inline_model = inline_model
         self._proto = ProtoSectionParser(self)
 
     def match(self, xe: XmlElement) -> bool:
-        return xe.tag in ['section', 'sec']
+        return xe.tag in self.TAGS
+
+    def match_tags(self) -> Iterable[str]:
+        return self.TAGS
 
     def load(self, log: Log, e: XmlElement) -> dom.Section | None:
-        kit.check_no_attrib(log, e, ['id'])
+        kit.check_no_attrib(log, e, ('id',))
         ret = dom.Section(e.attrib.get('id'))
         self._proto.parse(log, e, ret, ret.title)
         if ret.title.blank():
@@ -329,8 +414,13 @@ class SectionModel(kit.LoadModelBase[dom.Section]):
 
 
 class BodyModel(kit.Parser[dom.ProtoSection]):
-    def __init__(self, biblio: BiblioRefPool | None):
-        core = CoreModels(biblio, math=True, tables=True)
+    __slots__ = ('_proto',)
+
+    TAGS = ('article-body', 'body')
+
+    def __init__(self, biblio: BiblioRefPool | None, *, core: CoreModels | None = None):
+        if core is None:
+            core = core_models(biblio)
         self._proto = ProtoSectionParser(SectionModel(core.block, core.inline))
 
     def parse(self, log: Log, xe: XmlElement, target: dom.ProtoSection) -> bool:
@@ -341,4 +431,7 @@ class BodyModel(kit.Parser[dom.ProtoSection]):
     def match(self, xe: XmlElement) -> bool:
         # JATS and HTML conflict in use of <body> tag
         # DOMParser moves <body> position when parsed as HTML
-        return xe.tag in ['article-body', 'body']
+        return xe.tag in self.TAGS
+
+    def match_tags(self) -> Iterable[str]:
+        return self.TAGS
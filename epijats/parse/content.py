@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Generic, Protocol, TYPE_CHECKING, TypeAlias
 
 from .. import condition as fc
-from ..elements import ElementT
 from ..tree import (
     AppendCovT,
     Element,
@@ -31,6 +31,8 @@ Inline: TypeAlias = Element
 class BoundParser:
     """Same interface as Parser but log and destination are pre-bound."""
 
+    __slots__ = ('dest', 'parser')
+
     def __init__(self, parser: Parser[DestT], dest: DestT):
         self.parser = parser
         self.dest = dest
@@ -45,6 +47,8 @@ class BoundParser:
 
 
 class OnlyOnceParser(BoundParser):
+    __slots__ = ('_parse_done',)
+
     def __init__(self, parser: Parser[DestT], dest: DestT):
         super().__init__(parser, dest)
         self._parse_done = False
@@ -62,14 +66,16 @@ class OnlyOnceParser(BoundParser):
 class ArrayContentSession:
     """Parsing session for array (non-mixed, data-oriented) XML content."""
 
+    __slots__ = ('_parsers',)
+
     def __init__(self) -> None:
-        self._parsers: list[BoundParser] = []
+        self._parsers = kit.TagIndex[BoundParser]()
 
     def bind(self, parser: Parser[DestT], dest: DestT) -> None:
-        self._parsers.append(BoundParser(parser, dest))
+        self._parsers.add(BoundParser(parser, dest), parser.match_tags())
 
     def bind_once(self, parser: Parser[DestT], dest: DestT) -> None:
-        self._parsers.append(OnlyOnceParser(parser, dest))
+        self._parsers.add(OnlyOnceParser(parser, dest), parser.match_tags())
 
     def one(self, model: Model[ParsedT]) -> kit.Outcome[ParsedT]:
         ret = kit.SinkDestination[ParsedT]()
@@ -79,22 +85,30 @@ class ArrayContentSession:
     def parse_content(self, log: Log, xc: XmlContent) -> None:
         if xc.text and xc.text.strip():
             log(fc.IgnoredText.issue(xc))
+        candidates = self._parsers.get
         for s in xc:
             tail = s.tail
             s.tail = None
-            if not any(p.try_parse(log, s) for p in self._parsers):
+            for p in candidates(s.tag):
+                if p.try_parse(log, s):
+                    break
+            else:
                 log(fc.UnsupportedElement.issue(s))
             if tail and tail.strip():
                 log(fc.IgnoredTail.issue(s))
 
 
 class ContentModel(Protocol, Generic[AppendCovT]):
+    __slots__ = ()
+
     def parse_content(
         self, log: Log, xc: XmlContent, dest: Sink[AppendCovT]
     ) -> None: ...
 
 
 class MixedModel(Model[str | Inline], ContentModel[str | Inline]):
+    __slots__ = ()
+
     def parse_content(self, log: Log, xc: XmlContent, dest: Sink[str | Inline]) -> None:
         if xc.text:
             dest(xc.text)
@@ -115,12 +129,17 @@ class MixedModel(Model[str | Inline], ContentModel[str | Inline]):
 
 
 class UnionMixedModel(MixedModel):
+    __slots__ = ('_models',)
+
     def __init__(self) -> None:
         self._models = kit.UnionModel[str | Inline]()
 
     def match(self, xe: XmlElement) -> bool:
         return self._models.match(xe)
 
+    def match_tags(self) -> Iterable[str] | None:
+        return self._models.match_tags()
+
     def parse(self, log: Log, xe: XmlElement, sink: Sink[str | Inline]) -> bool:
         return self._models.parse(log, xe, sink)
 
@@ -132,17 +151,31 @@ class UnionMixedModel(MixedModel):
 ArrayContentModel: TypeAlias = ContentModel[Element]
 
 
-class DataContentModel(ContentModel[ElementT]):
-    def __init__(self, child_model: Model[ElementT]):
+class DataContentModel(ContentModel[ParsedT]):
+    __slots__ = ('child_model',)
+
+    def __init__(self, child_model: Model[ParsedT]):
         self.child_model = child_model
 
-    def parse_content(self, log: Log, xc: XmlElement, out: Sink[ElementT]) -> None:
-        sess = ArrayContentSession()
-        sess.bind(self.child_model, out)
-        sess.parse_content(log, xc)
+    def parse_content(self, log: Log, xc: XmlElement, out: Sink[ParsedT]) -> None:
+        # same as an ArrayContentSession with only child_model bound
+        if xc.text and xc.text.strip():
+            log(fc.IgnoredText.issue(xc))
+        child_model = self.child_model
+        for s in xc:
+            tail = s.tail
+            s.tail = None
+            if child_model.match(s):
+                child_model.parse(log, s, out)
+            else:
+                log(fc.UnsupportedElement.issue(s))
+            if tail and tail.strip():
+                log(fc.IgnoredTail.issue(s))
 
 
 class PendingMarkupBlock:
+    __slots__ = ('_pending', 'dest')
+
     def __init__(self, dest: Sink[Element], init: MixedParent | None = None):
         self.dest = dest
         self._pending = init
@@ -161,6 +194,8 @@ class PendingMarkupBlock:
 
 
 class RollContentModel(ArrayContentModel):
+    __slots__ = ('block_model', 'inline_model')
+
     def __init__(self, block_model: Model[Element], inline_model: MixedModel):
         self.block_model = block_model
         self.inline_model = inline_model
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import cache
 from typing import TYPE_CHECKING
 
 from .. import condition as fc
@@ -12,8 +14,13 @@ from ..tree import Element, MixedContent, MutableMixedContent
 from . import kit
 from .kit import Log, Model, LoaderTagModel as tag_model
 
-from .body import roll_model
-from .content import ArrayContentSession, MixedModel, UnionMixedModel
+from .body import CoreModels, roll_model
+from .content import (
+    ArrayContentSession,
+    DataContentModel,
+    MixedModel,
+    UnionMixedModel,
+)
 from .htmlish import (
     ext_link_model,
     formatted_text_model,
@@ -27,6 +34,7 @@ if TYPE_CHECKING:
     from ..typeshed import XmlElement
 
 
+@cache
 def copytext_model() -> MixedModel:
     # Corresponds to {COPYTEXT} in BpDF spec ed.2
     ret = UnionMixedModel()
@@ -35,10 +43,12 @@ def copytext_model() -> MixedModel:
     return ret
 
 
+@cache
 def copytext_element_model(tag: str) -> Model[str | Element]:
     return MixedContentInElementParser(tag, copytext_model())
 
 
+@cache
 def article_title_model() -> Model[str | Element]:
     # Contents corresponds to {MINITEXT} in BpDF spec ed.2
     # https://perm.pub/DPRkAz3vwSj85mBCgG49DeyndaE/2
@@ -48,9 +58,14 @@ def article_title_model() -> Model[str | Element]:
 
 
 class TitleGroupModel(kit.LoadModelBase[MixedContent]):
+    __slots__ = ()
+
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'title-group'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('title-group',)
+
     def load(self, log: Log, xe: XmlElement) -> dom.MixedContent | None:
         kit.check_no_attrib(log, xe)
         sess = ArrayContentSession()
@@ -61,11 +76,16 @@ class TitleGroupModel(kit.LoadModelBase[MixedContent]):
 
 
 class OrcidModel(kit.LoadModelBase[bp.Orcid]):
+    __slots__ = ()
+
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'contrib-id'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('contrib-id',)
+
     def load(self, log: Log, xe: XmlElement) -> bp.Orcid | None:
-        kit.check_no_attrib(log, xe, ['contrib-id-type'])
+        kit.check_no_attrib(log, xe, ('contrib-id-type',))
         kit.check_no_children(log, xe)
         ret = None
         url = xe.text or ""
@@ -83,9 +103,7 @@ def load_author_group(log: Log, e: XmlElement) -> list[bp.Author] | None:
     ret: list[bp.Author] = []
     kit.check_no_attrib(log, e)
     kit.check_required_child(log, e, 'contrib')
-    sess = ArrayContentSession()
-    sess.bind(tag_model('contrib', load_author), ret.append)
-    sess.parse_content(log, e)
+    _CONTRIB_GROUP_CONTENT.parse_content(log, e, ret.append)
     return ret
 
 
@@ -96,13 +114,13 @@ def person_name_model() -> Model[bp.PersonName]:
 def load_author(log: Log, e: XmlElement) -> bp.Author | None:
     if e.tag != 'contrib':
         return None
-    if not kit.confirm_attrib_value(log, e, 'contrib-type', ['author']):
+    if not kit.confirm_attrib_value(log, e, 'contrib-type', ('author',)):
         return None
-    kit.check_no_attrib(log, e, ['contrib-type'])
+    kit.check_no_attrib(log, e, ('contrib-type',))
     sess = ArrayContentSession()
-    name = sess.one(person_name_model())
-    email = sess.one(tag_model('email', kit.load_string))
-    orcid = sess.one(OrcidModel())
+    name = sess.one(_PERSON_NAME_MODEL)
+    email = sess.one(_EMAIL_MODEL)
+    orcid = sess.one(_ORCID_MODEL)
     sess.parse_content(log, e)
     if name.out is None:
         log(fc.MissingContent.issue(e, "Missing name"))
@@ -110,16 +128,30 @@ def load_author(log: Log, e: XmlElement) -> bp.Author | None:
     return bp.Author(name.out, email.out, orcid.out)
 
 
+_PERSON_NAME_MODEL = person_name_model()
+_EMAIL_MODEL = tag_model('email', kit.load_string)
+_ORCID_MODEL = OrcidModel()
+_CONTRIB_MODEL = tag_model('contrib', load_author)
+_CONTRIB_GROUP_CONTENT = DataContentModel(_CONTRIB_MODEL)
+
+
 class LicenseRefParser(kit.Parser[dom.License]):
+    __slots__ = ()
+
+    TAGS = (
+        "license-ref",
+        "license_ref",
+        "{http://www.niso.org/schemas/ali/1.0/}license_ref",
+    )
+
     def match(self, xe: XmlElement) -> bool:
-        return xe.tag in [
-            "license-ref",
-            "license_ref",
-            "{http://www.niso.org/schemas/ali/1.0/}license_ref",
-        ]
+        return xe.tag in self.TAGS
+
+    def match_tags(self) -> Iterable[str]:
+        return self.TAGS
 
     def parse(self, log: Log, xe: XmlElement, dest: dom.License) -> bool:
-        kit.check_no_attrib(log, xe, ['content-type'])
+        kit.check_no_attrib(log, xe, ('content-type',))
         dest.license_ref = kit.load_string_content(log, xe)
         from_attribute = kit.get_enum_value(log, xe, 'content-type', dom.CcLicenseType)
         if from_url := dom.CcLicenseType.from_url(dest.license_ref):
@@ -132,29 +164,43 @@ class LicenseRefParser(kit.Parser[dom.License]):
 
 
 class LicenseModel(kit.LoadModelBase[dom.License]):
+    __slots__ = ()
+
+    _LICENSE_REF = LicenseRefParser()
+
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'license'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('license',)
+
     def load(self, log: Log, e: XmlElement) -> dom.License | None:
         ret = dom.License()
         kit.check_no_attrib(log, e)
         sess = ArrayContentSession()
         sess.bind_once(copytext_element_model('license-p'), ret.license_p)
-        sess.bind_once(LicenseRefParser(), ret)
+        sess.bind_once(self._LICENSE_REF, ret)
         sess.parse_content(log, e)
         return None if ret.blank() else ret
 
 
 class PermissionsModel(kit.LoadModelBase[dom.Permissions]):
+    __slots__ = ()
+
+    _LICENSE = LicenseModel()
+
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'permissions'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('permissions',)
+
     def load(self, log: Log, e: XmlElement) -> dom.Permissions | None:
         kit.check_no_attrib(log, e)
         sess = ArrayContentSession()
         statement = MutableMixedContent()
         sess.bind_once(copytext_element_model('copyright-statement'), statement)
-        license = sess.one(LicenseModel())
+        license = sess.one(self._LICENSE)
         sess.parse_content(log, e)
         if license.out is None:
             return None
@@ -163,9 +209,11 @@ class PermissionsModel(kit.LoadModelBase[dom.Permissions]):
 
 
 class AbstractModel(kit.TagModelBase[Abstract]):
-    def __init__(self, biblio: BiblioRefPool | None):
+    __slots__ = ('content_model',)
+
+    def __init__(self, biblio: BiblioRefPool | None, *, core: CoreModels | None = None):
         super().__init__('abstract')
-        self.content_model = roll_model(biblio)
+        self.content_model = roll_model(biblio) if core is None else core.roll
 
     def load(self, log: Log, xe: XmlElement) -> Abstract | None:
         kit.check_no_attrib(log, xe)
@@ -175,20 +223,29 @@ class AbstractModel(kit.TagModelBase[Abstract]):
 
 
 class ArticleMetaParser(kit.Parser[dom.Article]):
+    __slots__ = ('_abstract_model',)
+
+    _TITLE_GROUP = TitleGroupModel()
+    _CONTRIB_GROUP = tag_model('contrib-group', load_author_group)
+    _PERMISSIONS = PermissionsModel()
+
     def __init__(self, abstract_model: Model[Abstract]):
         self._abstract_model = abstract_model
 
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'article-meta'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('article-meta',)
+
     def parse(self, log: Log, xe: XmlElement, dest: dom.Article) -> bool:
         kit.check_no_attrib(log, xe)
         kit.check_required_child(log, xe, 'title-group')
         sess = ArrayContentSession()
-        title = sess.one(TitleGroupModel())
-        authors = sess.one(tag_model('contrib-group', load_author_group))
+        title = sess.one(self._TITLE_GROUP)
+        authors = sess.one(self._CONTRIB_GROUP)
         abstract = sess.one(self._abstract_model)
-        permissions = sess.one(PermissionsModel())
+        permissions = sess.one(self._PERMISSIONS)
         sess.parse_content(log, xe)
         dest.title = title.out
         if authors.out is not None:
@@ -199,12 +256,17 @@ class ArticleMetaParser(kit.Parser[dom.Article]):
 
 
 class ArticleFrontParser(kit.Parser[dom.Article]):
+    __slots__ = ('_meta_model',)
+
     def __init__(self, abstract_model: Model[Abstract]):
         self._meta_model = ArticleMetaParser(abstract_model)
 
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'front'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('front',)
+
     def parse(self, log: Log, xe: XmlElement, dest: dom.Article) -> bool:
         kit.check_no_attrib(log, xe)
         kit.check_required_child(log, xe, 'article-meta')
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from functools import cache
 from typing import TYPE_CHECKING
 
 from .. import dom
@@ -33,6 +35,9 @@ if TYPE_CHECKING:
     from ..typeshed import XmlElement
 
 
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+
 def markup_model(
     tag: str | StartTag,
     content_model: ContentModel[str | Element],
@@ -43,13 +48,54 @@ def markup_model(
     return MixedParentModel(tm, content_model)
 
 
+class MarkupModel(MixedModel):
+    """Attribute-free inline markup elements like <b> and <i>.
+
+    Matching any of several tags is one dictionary lookup,
+    rather than a union of one model per tag.
+    """
+
+    __slots__ = ('_tags', 'content_model')
+
+    def __init__(
+        self, tags: Mapping[str, str], content_model: ContentModel[str | Element]
+    ):
+        # key is XML tag accepted, value is tag of the parsed element
+        self._tags = dict(tags)
+        self.content_model = content_model
+
+    def match(self, xe: XmlElement) -> bool:
+        return xe.tag in self._tags
+
+    def match_tags(self) -> Iterable[str]:
+        return self._tags.keys()
+
+    def parse(self, log: Log, xe: XmlElement, out: Sink[str | Element]) -> bool:
+        kit.check_no_attrib(log, xe)
+        ret = dom.MarkupInline(self._tags[str(xe.tag)])
+        self.content_model.parse_content(log, xe, ret.append)
+        out(ret)
+        return True
+
+    def __or__(self, model: Model[str | Element] | Model[Element]) -> MixedModel:
+        if (
+            isinstance(model, MarkupModel)
+            and model.content_model is self.content_model
+        ):
+            return MarkupModel(self._tags | model._tags, self.content_model)
+        return super().__or__(model)
+
+
 def minimally_formatted_text_model(content: MixedModel) -> MixedModel:
-    ret = UnionMixedModel()
-    ret |= markup_model('b', content, jats_name='bold')
-    ret |= markup_model('i', content, jats_name='italic')
-    ret |= markup_model('sub', content)
-    ret |= markup_model('sup', content)
-    return ret
+    tags = {
+        'b': 'b',
+        'bold': 'b',
+        'i': 'i',
+        'italic': 'i',
+        'sub': 'sub',
+        'sup': 'sup',
+    }
+    return MarkupModel(tags, content)
 
 
 def preformat_model(hypertext: MixedModel) -> Model[Element]:
@@ -67,6 +113,7 @@ def blockquote_model(roll_content_model: ArrayContentModel) -> Model[Element]:
     return ArrayParentModel(tm, roll_content_model)
 
 
+@cache
 def break_model() -> Model[Element]:
     """<break> Line Break
     Like HTML <br>.
@@ -82,12 +129,11 @@ def code_model(hypertext: MixedModel) -> Model[Element]:
 
 
 def formatted_text_model(content: MixedModel) -> MixedModel:
-    ret = UnionMixedModel()
-    ret |= minimally_formatted_text_model(content)
-    ret |= markup_model('tt', content, jats_name='monospace')
-    return ret
+    monospace = MarkupModel({'tt': 'tt', 'monospace': 'tt'}, content)
+    return minimally_formatted_text_model(content) | monospace
 
 
+@cache
 def hypotext_model() -> MixedModel:
     # Corresponds to {HYPOTEXT} in BpDF spec ed.2
     # https://perm.pub/DPRkAz3vwSj85mBCgG49DeyndaE/2
@@ -97,6 +143,8 @@ def hypotext_model() -> MixedModel:
 
 
 class ExtLinkModelBase(MixedModel):
+    __slots__ = ('content_model',)
+
     def __init__(self, content_model: MixedModel):
         self.content_model = content_model
 
@@ -119,20 +167,28 @@ class ExtLinkModelBase(MixedModel):
 
 
 class JatsExtLinkModel(ExtLinkModelBase):
+    __slots__ = ()
+
+    OK_ATTRIB = ("ext-link-type", XLINK_HREF)
+
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'ext-link'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('ext-link',)
+
     def parse(self, log: Log, e: XmlElement, out: Sink[str | Element]) -> bool:
         link_type = e.attrib.get("ext-link-type")
         if link_type and link_type != "uri":
             log(fc.UnsupportedAttributeValue.issue(e, "ext-link-type", link_type))
             return False
-        k_href = "{http://www.w3.org/1999/xlink}href"
-        kit.check_no_attrib(log, e, ["ext-link-type", k_href])
-        return self.parse_url(log, e, k_href, out)
+        kit.check_no_attrib(log, e, self.OK_ATTRIB)
+        return self.parse_url(log, e, XLINK_HREF, out)
 
 
 class HtmlExtLinkModel(ExtLinkModelBase):
+    __slots__ = ('stag',)
+
     def __init__(self, content_model: MixedModel):
         super().__init__(content_model)
         self.stag = StartTag('a', {'rel': 'external'})
@@ -140,8 +196,11 @@ class HtmlExtLinkModel(ExtLinkModelBase):
     def match(self, xe: XmlElement) -> bool:
         return self.stag.issubset(xe)
 
+    def match_tags(self) -> Iterable[str]:
+        return (self.stag.name,)
+
     def parse(self, log: Log, xe: XmlElement, out: Sink[str | Element]) -> bool:
-        kit.check_no_attrib(log, xe, ['rel', 'href'])
+        kit.check_no_attrib(log, xe, ('rel', 'href'))
         return self.parse_url(log, xe, 'href', out)
 
 
@@ -150,6 +209,8 @@ def ext_link_model(content_model: MixedModel) -> MixedModel:
 
 
 class HtmlParagraphModel(Model[Element]):
+    __slots__ = ('block_model', 'inline_model')
+
     def __init__(self, hypertext: MixedModel, block: Model[Element]):
         self.inline_model = hypertext
         self.block_model = block
@@ -157,28 +218,34 @@ class HtmlParagraphModel(Model[Element]):
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'p'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('p',)
+
     def parse(self, log: Log, xe: XmlElement, out: Sink[Element]) -> bool:
         # ignore JATS <p specific-use> attribute from BpDF ed.1
-        kit.check_no_attrib(log, xe, ['specific-use'])
+        kit.check_no_attrib(log, xe, ('specific-use',))
+        inline_model = self.inline_model
+        block_model = self.block_model
         pending = PendingMarkupBlock(out, dom.Paragraph())
+        append = pending.append
         autoclosed = False
         if xe.text:
-            pending.append(xe.text)
+            append(xe.text)
         for s in xe:
-            if self.inline_model.match(s):
-                self.inline_model.parse(log, s, pending.append)
-            elif self.block_model.match(s):
+            if inline_model.match(s):
+                inline_model.parse(log, s, append)
+            elif block_model.match(s):
                 pending.close()
                 autoclosed = True
                 log(fc.BlockElementInPhrasingContent.issue(s))
-                self.block_model.parse(log, s, out)
+                block_model.parse(log, s, out)
                 if s.tail and not s.tail.strip():
                     s.tail = None
             else:
                 log(fc.UnsupportedElement.issue(s))
-                self.inline_model.parse_content(log, s, pending.append)
+                inline_model.parse_content(log, s, append)
             if s.tail:
-                pending.append(s.tail)
+                append(s.tail)
         if not pending.close() or autoclosed:
             out(dom.Paragraph(" "))
         if xe.tail:
@@ -187,17 +254,24 @@ class HtmlParagraphModel(Model[Element]):
 
 
 class ListModel(kit.LoadModelBase[Element]):
+    TAGS = ('ul', 'ol', 'list')
+
+    __slots__ = ('_list_content',)
+
     def __init__(self, roll_content_model: ArrayContentModel):
         li_tag_model = TagModel(dom.ListItem, jats_name='list-item')
         li_element_model = ArrayParentModel(li_tag_model, roll_content_model)
         self._list_content = DataContentModel(li_element_model)
 
     def match(self, xe: XmlElement) -> bool:
-        return xe.tag in ['ul', 'ol', 'list']
+        return xe.tag in self.TAGS
+
+    def match_tags(self) -> Iterable[str]:
+        return self.TAGS
 
     def load(self, log: Log, xe: XmlElement) -> Element | None:
         if xe.tag == 'list':
-            kit.check_no_attrib(log, xe, ['list-type'])
+            kit.check_no_attrib(log, xe, ('list-type',))
             list_type = xe.attrib.get('list-type')
             tag = 'ol' if list_type == 'order' else 'ul'
         else:
@@ -229,12 +303,19 @@ def def_def_model(def_content: ArrayContentModel) -> Model[dom.DDefinition]:
 class DefListItemModel(kit.LoadModelBase[dom.DItem]):
     """Description list item. HTML a <div> under <dl>, in JATS a <def-item>."""
 
+    TAGS = ('div', 'def-item')
+
+    __slots__ = ('dd_element_model', 'dt_element_model')
+
     def __init__(self, term_text: MixedModel, def_content: ArrayContentModel):
         self.dt_element_model = def_term_model(term_text)
         self.dd_element_model = def_def_model(def_content)
 
     def match(self, xe: XmlElement) -> bool:
-        return xe.tag in ['div', 'def-item']
+        return xe.tag in self.TAGS
+
+    def match_tags(self) -> Iterable[str]:
+        return self.TAGS
 
     def load(self, log: Log, xe: XmlElement) -> dom.DItem | None:
         kit.check_no_attrib(log, xe)
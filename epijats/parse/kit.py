@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Container, Iterable, Mapping, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Generic, Protocol, TYPE_CHECKING, TypeAlias, TypeVar
@@ -10,6 +11,7 @@ from .. import condition as fc
 from ..tree import StartTag
 
 if TYPE_CHECKING:
+    from ..tree import Element
     from ..typeshed import XmlElement
     import lxml.etree
 
@@ -33,12 +35,23 @@ def issue(
     return log(fc.XmlFormatIssue(condition, sourceline, info))
 
 
-def check_no_attrib(log: Log, e: XmlElement, ignore: Iterable[str] = []) -> None:
+def check_no_attrib(log: Log, e: XmlElement, ignore: Container[str] = ()) -> None:
     for k in e.attrib.keys():
         if k not in ignore:
             log(fc.UnsupportedAttribute.issue(e, k))
 
 
+def copy_ok_attrib_values(
+    log: Log, e: XmlElement, ok: AbstractSet[str], dest: Element
+) -> None:
+    fixed = dest.tag.attrib
+    for key, value in e.attrib.items():
+        if key not in ok:
+            log(fc.UnsupportedAttribute.issue(e, key))
+        elif key not in fixed:
+            dest.set_attrib(key, value)
+
+
 def check_required_child(log: Log, xe: XmlElement, tags: Iterable[str] | str) -> None:
     if isinstance(tags, str):
         tags = [tags]
@@ -78,9 +91,9 @@ def get_enum_value(
 ) -> EnumT | None:
     ret: EnumT | None = None
     if got := e.attrib.get(key):
-        if got in enum:
+        try:
             ret = enum(got)
-        else:
+        except ValueError:
             log(fc.UnsupportedAttributeValue.issue(e, key, got))
     return ret
 
@@ -101,15 +114,22 @@ def load_string(log: Log, e: XmlElement) -> str:
 
 
 def load_string_content(log: Log, e: XmlElement) -> str:
-    frags = []
+    if not len(e):
+        # common case of text-only element
+        return e.text or ""
+    frags: list[str] = []
+    _append_string_content(log, e, frags)
+    return "".join(frags)
+
+
+def _append_string_content(log: Log, e: XmlElement, frags: list[str]) -> None:
     if e.text:
         frags.append(e.text)
     for s in e:
         log(fc.UnsupportedElement.issue(s))
-        frags += load_string_content(log, s)
+        _append_string_content(log, s, frags)
         if s.tail:
             frags.append(s.tail)
-    return "".join(frags)
 
 
 def load_int(
@@ -130,11 +150,20 @@ def load_int(
 
 
 class Parser(ABC, Generic[DestConT]):
+    __slots__ = ()
+
     @abstractmethod
     def match(self, xe: XmlElement) -> bool:
         """Test whether Parser handles an element, without issue logging."""
         ...
 
+    def match_tags(self) -> Iterable[str] | None:
+        """Tags of all elements that can match, or None if not known in advance.
+
+        Content sessions use this to skip parsers that can not match an element.
+        """
+        return None
+
     @abstractmethod
     def parse(self, log: Log, xe: XmlElement, dest: DestConT) -> bool:
         """Parse XmlElement and log any parsing issues. Only call if match True.
@@ -155,15 +184,74 @@ class Parser(ABC, Generic[DestConT]):
         return ret
 
 
+ItemT = TypeVar('ItemT')
+
+
+class TagIndex(Generic[ItemT]):
+    """Items, in order added, indexed by the element tags they might match."""
+
+    __slots__ = ('_any_tag', '_by_tag')
+
+    def __init__(self) -> None:
+        self._by_tag: dict[object, list[ItemT]] = {}
+        # items that might match elements of any tag
+        self._any_tag: list[ItemT] = []
+
+    def add(self, item: ItemT, tags: Iterable[str] | None) -> None:
+        if tags is None:
+            self._any_tag.append(item)
+            for candidates in self._by_tag.values():
+                candidates.append(item)
+        else:
+            # an item listed twice under a tag would be tried twice
+            for tag in dict.fromkeys(tags):
+                if tag not in self._by_tag:
+                    self._by_tag[tag] = list(self._any_tag)
+                self._by_tag[tag].append(item)
+
+    def get(self, tag: object) -> Sequence[ItemT]:
+        """Items, in order added, that might match an element with the tag."""
+        return self._by_tag.get(tag, self._any_tag)
+
+
 class UnionParser(Parser[DestT]):
+    __slots__ = ('_index', '_parsers')
+
     def __init__(self) -> None:
         self._parsers: list[Parser[DestT]] = []
+        # built on first use from the match_tags of the parsers
+        self._index: TagIndex[Parser[DestT]] | None = None
+
+    def _candidates(self, xe: XmlElement) -> Sequence[Parser[DestT]]:
+        index = self._index
+        if index is None:
+            index = TagIndex()
+            for p in self._parsers:
+                index.add(p, p.match_tags())
+            # publish only once complete, other threads may share this parser
+            self._index = index
+        return index.get(xe.tag)
 
     def match(self, xe: XmlElement) -> bool:
-        return any(p.match(xe) for p in self._parsers)
+        for p in self._candidates(xe):
+            if p.match(xe):
+                return True
+        return False
+
+    def match_tags(self) -> Iterable[str] | None:
+        tags: list[str] = []
+        for p in self._parsers:
+            more = p.match_tags()
+            if more is None:
+                return None
+            tags.extend(more)
+        return tags
 
     def parse(self, log: Log, xe: XmlElement, dest: DestT) -> bool:
-        return any(p.match_and_parse(log, xe, dest) for p in self._parsers)
+        for p in self._candidates(xe):
+            if p.match_and_parse(log, xe, dest):
+                return True
+        return False
 
     def __or__(self, other: Parser[DestT]) -> Parser[DestT]:
         ret = UnionParser[DestT]()
@@ -172,6 +260,7 @@ class UnionParser(Parser[DestT]):
 
     def __ior__(self, other: Parser[DestT]) -> UnionParser[DestT]:
         self._parsers.append(other)
+        self._index = None
         return self
 
 
@@ -181,6 +270,8 @@ UnionModel: TypeAlias = UnionParser[Sink[ParsedT]]
 
 
 class LoadModelBase(Model[ParsedT]):
+    __slots__ = ()
+
     @abstractmethod
     def load(self, log: Log, e: XmlElement) -> ParsedT | None: ...
 
@@ -199,14 +290,26 @@ class LoadModelBase(Model[ParsedT]):
 
 
 class TagModelBase(LoadModelBase[ParsedT]):
+    __slots__ = ('stag',)
+
     def __init__(self, tag: str | StartTag):
-        self.stag = StartTag(tag)
+        # StartTag is immutable so can be shared
+        self.stag = tag if isinstance(tag, StartTag) else StartTag(tag)
 
     def match(self, xe: XmlElement) -> bool:
-        return self.stag.issubset(xe)
+        stag = self.stag
+        if not stag.attrib:
+            # common case of matching by tag alone
+            return xe.tag == stag.name
+        return stag.issubset(xe)
+
+    def match_tags(self) -> Iterable[str]:
+        return (self.stag.name,)
 
 
 class LoaderTagModel(TagModelBase[ParsedT]):
+    __slots__ = ('_loader',)
+
     def __init__(self, tag: str, loader: Loader[ParsedT]):
         super().__init__(tag)
         self._loader = loader
@@ -216,11 +319,13 @@ class LoaderTagModel(TagModelBase[ParsedT]):
 
 
 class Outcome(Protocol[ParsedCovT]):
+    __slots__ = ()
+
     @property
     def out(self) -> ParsedCovT | None: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class SinkDestination(Outcome[ParsedT]):
     out: ParsedT | None = None
 
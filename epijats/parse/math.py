@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import cache
 from typing import TYPE_CHECKING
 
 from ..math import (
@@ -52,11 +54,16 @@ MATHML_TAGS = [
 
 
 class AnyMathmlModel(MixedModel):
+    __slots__ = ()
+
     XML_TAGS = {(MATHML_NAMESPACE_PREFIX + tag) for tag in MATHML_TAGS}
 
     def match(self, xe: XmlElement) -> bool:
         return xe.tag in self.XML_TAGS
 
+    def match_tags(self) -> Iterable[str]:
+        return self.XML_TAGS
+
     def parse(self, log: Log, xe: XmlElement, dest: Sink[str | Element]) -> bool:
         assert isinstance(xe.tag, str)
         ret = MathmlElement(StartTag(xe.tag, dict(xe.attrib)))
@@ -71,6 +78,8 @@ class MathmlElementModel(kit.LoadModelBase[Element]):
     https://jats.nlm.nih.gov/articleauthoring/tag-library/1.4/element/mml-math.html
     """
 
+    __slots__ = ('_model', 'mathml_tag', 'tag')
+
     def __init__(self, mathml_tag: str):
         self.tag = MATHML_NAMESPACE_PREFIX + mathml_tag
         self._model = AnyMathmlModel()
@@ -79,6 +88,9 @@ class MathmlElementModel(kit.LoadModelBase[Element]):
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == self.tag
 
+    def match_tags(self) -> Iterable[str]:
+        return (self.tag,)
+
     def load(self, log: Log, e: XmlElement) -> Element | None:
         ret = MathmlElement(StartTag(self.tag, dict(e.attrib)))
         self._model.parse_content(log, e, ret.append)
@@ -91,6 +103,11 @@ class FormulaAlternativesModel(kit.TagModelBase[Element]):
     https://jats.nlm.nih.gov/publishing/tag-library/1.4/element/alternatives.html
     """
 
+    __slots__ = ('formula_style',)
+
+    _TEX = kit.LoaderTagModel('tex-math', kit.load_string)
+    _MATHML = MathmlElementModel('math')
+
     def __init__(self, formula_style: FormulaStyle):
         super().__init__('alternatives')
         self.formula_style = formula_style
@@ -98,8 +115,8 @@ class FormulaAlternativesModel(kit.TagModelBase[Element]):
     def load(self, log: Log, e: XmlElement) -> Element | None:
         kit.check_no_attrib(log, e)
         cp = ArrayContentSession()
-        tex = cp.one(kit.LoaderTagModel('tex-math', kit.load_string))
-        mathml = cp.one(MathmlElementModel('math'))
+        tex = cp.one(self._TEX)
+        mathml = cp.one(self._MATHML)
         cp.parse_content(log, e)
         if not tex.out:
             return None
@@ -113,6 +130,8 @@ class FormulaAlternativesModel(kit.TagModelBase[Element]):
 
 
 class FormulaModel(kit.TagModelBase[Element]):
+    __slots__ = ('child_model',)
+
     def __init__(self, formula_style: FormulaStyle):
         super().__init__(formula_style.jats_tag)
         self.child_model = FormulaAlternativesModel(formula_style)
@@ -125,6 +144,7 @@ class FormulaModel(kit.TagModelBase[Element]):
         return result.out
 
 
+@cache
 def inline_formula_model() -> kit.Model[str | Element]:
     """<inline-formula> Formula, Inline
 
@@ -133,6 +153,7 @@ def inline_formula_model() -> kit.Model[str | Element]:
     return FormulaModel(FormulaStyle.INLINE)
 
 
+@cache
 def disp_formula_model() -> kit.Model[Element]:
     """<disp-formula> Formula, Display
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, TypeVar
 
 from .. import dom
-from .. import condition as fc
 from ..tree import (
     ArrayParent,
     Element,
@@ -29,6 +29,8 @@ if TYPE_CHECKING:
 
 
 class TableCellModel(kit.LoadModelBase[dom.TableCell]):
+    __slots__ = ('_ok_attrib_keys', 'content_model', 'header', 'tag')
+
     def __init__(self, content_model: ArrayContentModel, *, header: bool):
         self.header = header
         self.tag = 'th' if header else 'td'
@@ -38,20 +40,21 @@ class TableCellModel(kit.LoadModelBase[dom.TableCell]):
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == self.tag
 
+    def match_tags(self) -> Iterable[str]:
+        return (self.tag,)
+
     def load(self, log: Log, e: XmlElement) -> dom.TableCell | None:
         align_attribs = {'left', 'right', 'center', 'justify', None}
         kit.confirm_attrib_value(log, e, 'align', align_attribs)
         ret = dom.TableCell(header=self.header)
-        for key, value in e.attrib.items():
-            if key in self._ok_attrib_keys:
-                ret.set_attrib(key, value)
-            else:
-                log(fc.UnsupportedAttribute.issue(e, key))
+        kit.copy_ok_attrib_values(log, e, self._ok_attrib_keys, ret)
         self.content_model.parse_content(log, e, ret.append)
         return ret
 
 
 class TableColumnGroupModel(ElementLoadModelBase[dom.TableColumnGroup]):
+    __slots__ = ('content_model',)
+
     def __init__(self) -> None:
         tm = TagModel(dom.TableColumnGroup, optional_attrib={'span', 'width'})
         super().__init__(tm)
@@ -67,6 +70,8 @@ class TableColumnGroupModel(ElementLoadModelBase[dom.TableColumnGroup]):
 
 
 class TableRowModel(ElementLoadModelBase[dom.TableRow]):
+    __slots__ = ('content_model',)
+
     def __init__(self, cell_content: ArrayContentModel):
         super().__init__(TagModel(dom.TableRow))
         th = TableCellModel(cell_content, header=True)
@@ -83,6 +88,8 @@ RowParentT = TypeVar('RowParentT', bound=Parent[dom.TableRow])
 
 
 class RowParentModel(ElementLoadModelBase[RowParentT]):
+    __slots__ = ('content_model',)
+
     def __init__(
         self, tag_model: TagModel[RowParentT], child_model: Model[dom.TableRow]
     ):
@@ -96,6 +103,8 @@ class RowParentModel(ElementLoadModelBase[RowParentT]):
 
 
 class TableModel(kit.LoadModelBase[dom.Table]):
+    __slots__ = ('colgroups', 'tbody', 'tfoot', 'thead')
+
     def __init__(self, cell_content: ArrayContentModel):
         tr = TableRowModel(cell_content)
         self.colgroups = TableColumnGroupModel()
@@ -106,15 +115,12 @@ class TableModel(kit.LoadModelBase[dom.Table]):
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == 'table'
 
+    def match_tags(self) -> Iterable[str]:
+        return ('table',)
+
     def load(self, log: Log, xe: XmlElement) -> dom.Table | None:
-        attribs = {'frame', 'rules'}
-        kit.check_no_attrib(log, xe, attribs)
         ret = dom.Table()
-        for key, value in xe.attrib.items():
-            if key not in attribs:
-                log(fc.UnsupportedAttribute.issue(xe, key))
-            else:
-                ret.set_attrib(key, value)
+        kit.copy_ok_attrib_values(log, xe, {'frame', 'rules'}, ret)
         sess = ArrayContentSession()
         sess.bind(self.colgroups, ret.colgroups.append)
         head = sess.one(self.thead)
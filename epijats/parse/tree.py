@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import Generic, TYPE_CHECKING, TypeVar
 
-from .. import condition as fc
 from ..elements import ElementT
 from ..tree import (
     Element,
@@ -29,12 +29,17 @@ if TYPE_CHECKING:
 
 
 class TrivialElementModel(kit.LoadModelBase[str]):
+    __slots__ = ('tag',)
+
     def __init__(self, tag: str):
         self.tag = tag
 
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == self.tag
 
+    def match_tags(self) -> Iterable[str]:
+        return (self.tag,)
+
     def load(self, log: Log, xe: XmlElement) -> str | None:
         kit.check_no_attrib(log, xe)
         kit.check_no_content(log, xe)
@@ -45,6 +50,8 @@ ElementCovT = TypeVar('ElementCovT', bound=Element, covariant=True)
 
 
 class TagModel(Generic[ElementCovT]):
+    __slots__ = ('_ok_attrib_keys', 'element_type', 'factory', 'jats_name', 'tag')
+
     def __init__(
         self,
         element_type: type[ElementCovT],
@@ -55,7 +62,7 @@ class TagModel(Generic[ElementCovT]):
     ):
         self.element_type = element_type
         if tag is not None:
-            self.tag = StartTag(tag)
+            self.tag = tag if isinstance(tag, StartTag) else StartTag(tag)
 
             def factory() -> ElementCovT:
                 return self.element_type(tag)
@@ -70,26 +77,34 @@ class TagModel(Generic[ElementCovT]):
     def match(self, xe: XmlElement) -> bool:
         if self.jats_name is not None and xe.tag == self.jats_name:
             return True
+        if not self.tag.attrib:
+            # common case of matching by tag alone
+            return xe.tag == self.tag.name
         return self.tag.issubset(xe)
 
+    def match_tags(self) -> Iterable[str]:
+        if self.jats_name is None:
+            return (self.tag.name,)
+        return (self.tag.name, self.jats_name)
+
     def start(self, log: Log, xe: XmlElement) -> ElementCovT | None:
-        kit.check_no_attrib(log, xe, self._ok_attrib_keys)
         ret = self.factory()
-        for key, value in xe.attrib.items():
-            if key not in self._ok_attrib_keys:
-                log(fc.UnsupportedAttribute.issue(xe, key))
-            elif key not in self.tag.attrib:
-                ret.set_attrib(key, value)
+        kit.copy_ok_attrib_values(log, xe, self._ok_attrib_keys, ret)
         return ret
 
 
 class ElementLoadModelBase(kit.LoadModelBase[ElementT]):
+    __slots__ = ('tag_model',)
+
     def __init__(self, tag_model: TagModel[ElementT]):
         self.tag_model = tag_model
 
     def match(self, xe: XmlElement) -> bool:
         return self.tag_model.match(xe)
 
+    def match_tags(self) -> Iterable[str]:
+        return self.tag_model.match_tags()
+
     @abstractmethod
     def parse_content(self, log: Log, xc: XmlContent, dest: ElementT) -> None: ...
 
@@ -101,14 +116,20 @@ class ElementLoadModelBase(kit.LoadModelBase[ElementT]):
 
 
 class EmptyElementModel(ElementLoadModelBase[ElementT]):
+    __slots__ = ()
+
     def parse_content(self, log: Log, xc: XmlContent, dest: ElementT) -> None:
-        kit.check_no_content(log, xc)
+        # common case of truly empty element like <break/> needs no checking
+        if xc.text or len(xc):
+            kit.check_no_content(log, xc)
 
 
 ArrayParentT = TypeVar('ArrayParentT', bound=Parent[Element])
 
 
 class ArrayParentModel(ElementLoadModelBase[ArrayParentT]):
+    __slots__ = ('content_model',)
+
     def __init__(
         self, tag_model: TagModel[ArrayParentT], content_model: ContentModel[Element]
     ):
@@ -120,6 +141,8 @@ class ArrayParentModel(ElementLoadModelBase[ArrayParentT]):
 
 
 class DataParentModel(ElementLoadModelBase[Parent[ElementT]]):
+    __slots__ = ('content_model',)
+
     def __init__(
         self, tag_model: TagModel[Parent[ElementT]], child_model: Model[ElementT]
     ):
@@ -134,6 +157,8 @@ MixedParentT = TypeVar('MixedParentT', bound=Parent[str | Element])
 
 
 class MixedParentModel(ElementLoadModelBase[MixedParentT]):
+    __slots__ = ('content_model',)
+
     def __init__(
         self,
         tag_model: TagModel[MixedParentT],
@@ -149,11 +174,15 @@ class MixedParentModel(ElementLoadModelBase[MixedParentT]):
 
 
 class MarkupBlockModel(MixedParentModel[MixedParent]):
+    __slots__ = ()
+
     def __init__(self, inline_model: MixedModel):
         super().__init__(TagModel(MarkupBlock), inline_model)
 
 
 class MixedContentInElementParser(kit.Model[str | Element]):
+    __slots__ = ('content_model', 'tag')
+
     def __init__(self, tag: str, content_model: ContentModel[str | Element]):
         self.content_model = content_model
         self.tag = tag
@@ -161,6 +190,9 @@ class MixedContentInElementParser(kit.Model[str | Element]):
     def match(self, xe: XmlElement) -> bool:
         return xe.tag == self.tag
 
+    def match_tags(self) -> Iterable[str]:
+        return (self.tag,)
+
     def parse(self, log: Log, xe: XmlElement, out: Sink[str | Element]) -> bool:
         kit.check_no_attrib(log, xe)
         self.content_model.parse_content(log, xe, out)
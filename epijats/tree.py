@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
@@ -21,7 +22,7 @@ class StartTag:
 
     def __init__(self, tag: str | StartTag, attrib: Mapping[str, str] = {}):
         if isinstance(tag, str):
-            self._name = tag
+            self._name = sys.intern(tag)
             self._attrib = dict(attrib)
         else:
             self._name = tag.name
@@ -46,11 +47,12 @@ class StartTag:
         return StartTag(xe.tag, attrib) if isinstance(xe.tag, str) else None
 
     def issubset(self, x: StartTag | XmlElement) -> bool:
-        other = x if isinstance(x, StartTag) else StartTag.from_xml(x)
-        if other is None or self.name != other.name:
+        # compare against XML element directly rather than copy into a StartTag
+        if x.tag != self._name:
             return False
-        for key, value in self.attrib.items():
-            if other.attrib.get(key) != value:
+        other_attrib = x.attrib
+        for key, value in self._attrib.items():
+            if other_attrib.get(key) != value:
                 return False
         return True
 
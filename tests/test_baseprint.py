@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os, pytest
+from collections import Counter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,7 @@ from epijats.document import Abstract
 from epijats.elements import Paragraph
 from epijats.metadata import BiblioRefItem
 from epijats.parse import parse_baseprint, parse_baseprint_root
+from epijats.parse.baseprint import load_article_stream
 from epijats.parse.front import AbstractModel, load_author_group
 from epijats.tree import Element
 from epijats.xml import html
@@ -117,6 +119,18 @@ def test_article(case):
     assert_eq_if_exists(references, case_path / "references.html")
 
 
+@pytest.mark.parametrize("case", os.listdir(ARTICLE_CASE))
+def test_article_stream(case):
+    case_path = ARTICLE_CASE / case
+    issues = []
+    expect = parse_baseprint(case_path, issues.append)
+    stream_issues = []
+    got = load_article_stream(stream_issues.append, case_path)
+    assert got == expect
+    # issues within <ref> are logged earlier when streaming, so ignore order
+    assert Counter(map(str, stream_issues)) == Counter(map(str, issues))
+
+
 def test_minimal_html_title():
     bp = parse_baseprint(SNAPSHOT_CASE / "baseprint")
     assert HTML.content_to_str(bp.title) == 'A test'
@@ -215,6 +229,14 @@ def test_bare_citation():
     assert str_from_element(el) == expect
 
 
+def test_invalid_citation_logged_once():
+    issues = []
+    core = _.core_models(mock_biblio_pool())
+    start = """<p>See <xref rid="R9" ref-type="bibr">9</xref>.</p>"""
+    parse_inline_element(issues.append, core.block, start)
+    assert [type(i.condition) for i in issues] == [fc.InvalidCitation]
+
+
 def test_author_restyle():
     expect = """\
 <contrib-group>